@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Flyway Corridor Utilities
+Common functionality shared across the flyway corridor county selection scripts
+"""
+
+import os
+import ssl
+import tempfile
+import time
+import urllib.request
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+# 1:500k generalized counties – fine for selection; swap for TIGER if you want higher detail
+COUNTIES_URL = "https://www2.census.gov/geo/tiger/GENZ2018/shp/cb_2018_us_county_500k.zip"
+COUNTIES_FALLBACK_URL = "https://raw.githubusercontent.com/holtzy/The-Python-Graph-Gallery/master/static/data/US-counties.geojson"
+COUNTIES_CACHE = os.path.join(tempfile.gettempdir(), "cb_2018_us_county_500k.zip")
+
+ALBERS = 5070  # CONUS Albers (meters)
+
+# Column order of the <flyway>_counties_with_urls.csv files read by the scrapers
+URL_COLUMNS = ["state","state_abbr","county","GEOID","county_fips3","birdcast_url"]
+
+# Only the attributes the corridor scripts use; everything else is skipped at read time
+COUNTY_COLUMNS = ["STATEFP", "COUNTYFP", "GEOID", "NAME", "geometry"]
+
+def install_ssl_opener():
+    """
+    Install a urllib opener that skips SSL certificate verification
+    (works around certificate issues when downloading the Census data)
+    """
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context))
+    urllib.request.install_opener(opener)
+
+def load_counties(cache=COUNTIES_CACHE):
+    """
+    Load US counties (Census), downloading the shapefile only if it is not cached locally
+
+    Args:
+        cache: Path of the local copy of the Census counties zip
+
+    Returns:
+        GeoDataFrame of counties in WGS84 (EPSG:4326)
+    """
+    install_ssl_opener()
+    try:
+        if os.path.exists(cache):
+            print(f"Loading US counties data from cache: {cache}")
+        else:
+            print("Downloading US counties data...")
+            # Download to a temporary name so an interrupted fetch never leaves a broken cache
+            urllib.request.urlretrieve(COUNTIES_URL, cache + ".part")
+            os.replace(cache + ".part", cache)
+        counties = gpd.read_file(cache, engine="pyogrio", columns=COUNTY_COLUMNS).to_crs(4326)
+        print(f"Successfully loaded {len(counties)} counties from Census Bureau")
+    except Exception as e:
+        print(f"Error downloading Census data: {e}")
+        print("Trying alternative approach...")
+        # Alternative: use a different source or local file
+        counties = gpd.read_file(
+            COUNTIES_FALLBACK_URL, engine="pyogrio", columns=COUNTY_COLUMNS
+        ).to_crs(4326)
+        print(f"Successfully loaded {len(counties)} counties from alternative source")
+
+    return counties
+
+def filter_to_states(counties, statefps, flyway_name):
+    """
+    Keep only counties in/near the corridor states to speed things up
+
+    Args:
+        counties: GeoDataFrame of counties with a STATEFP column
+        statefps: Iterable of 2-digit state FIPS codes to keep
+        flyway_name: Name of the flyway for progress messages
+
+    Returns:
+        Filtered copy of the counties GeoDataFrame
+    """
+    print(f"Filtering to {flyway_name} corridor states...")
+    keep_arr = np.array(sorted(statefps), dtype="U2")
+    state_mask = np.isin(counties["STATEFP"].to_numpy(dtype="U2"), keep_arr)
+    counties = counties.iloc[state_mask].copy()
+    print(f"Filtered to {len(counties)} counties in {flyway_name} corridor states")
+    return counties
+
+def select_corridor_counties(counties, spine_ll, buffer_km):
+    """
+    Select the counties whose centroid falls within a fixed-width buffer around the spine
+
+    Args:
+        counties: GeoDataFrame of counties in WGS84 (EPSG:4326)
+        spine_ll: LineString tracing the corridor in lon/lat
+        buffer_km: Corridor half-width in kilometers
+
+    Returns:
+        GeoDataFrame of the counties inside the corridor, in CONUS Albers
+        (only the GeoJSON output needs WGS84, see save_corridor_outputs)
+    """
+    # -------------------------------------------
+    # Buffer by a fixed kilometer width
+    # -------------------------------------------
+    # Project to CONUS Albers (meters) for accurate buffering
+    print("Projecting coordinates and creating corridor buffer...")
+
+    # Cheap lon/lat bbox pre-filter so only counties near the spine get reprojected.
+    # A degree of longitude shrinks with latitude, so size the pad for the northernmost
+    # spine point and double it for slack (projection distortion, county extents).
+    pad_deg = 2 * buffer_km / (111.0 * np.cos(np.radians(spine_ll.bounds[3])))
+    minx, miny, maxx, maxy = spine_ll.buffer(pad_deg).bounds
+    counties = counties.cx[minx:maxx, miny:maxy]
+    print(f"Bounding box pre-filter kept {len(counties)} counties")
+
+    counties_alb = counties.to_crs(ALBERS)
+    spine_alb   = gpd.GeoSeries([spine_ll], crs=4326).to_crs(ALBERS).iloc[0]
+
+    # Default 16 segments per quarter circle: coarser arcs cut into the corridor edge
+    # and drop boundary counties whose centroids lie just inside buffer_km
+    corridor_poly = spine_alb.buffer(buffer_km * 1000)  # meters
+    shapely.prepare(corridor_poly)  # build the spatial index once for the containment tests
+    print(f"Created corridor buffer of ±{buffer_km} km")
+
+    # -------------------------------------------
+    # Select counties by centroid-within
+    # -------------------------------------------
+    print("Selecting counties within corridor...")
+    # Vectorized centroid calculation (shapely 2.x loops over the geometry array in C)
+    centroids = counties_alb.geometry.centroid
+
+    print("Checking which counties fall within corridor...")
+    # Point-in-polygon check straight on the centroid coordinate arrays. This is a single
+    # GEOS call over a few hundred points, so it stays single-threaded; parallelism is
+    # applied per flyway in run_all_flyways.py instead of partitioning this mask.
+    # It also stays on the prepared GEOS predicate rather than a JIT-compiled ray-cast:
+    # the buffered corridor can come back with holes or as a MultiPolygon, which GEOS
+    # handles and an exterior-ring ray-cast would not.
+    xs = centroids.x.to_numpy()
+    ys = centroids.y.to_numpy()
+
+    # Filter/refine: rule out centroids outside the corridor's bounding box with plain
+    # float comparisons, then run the exact containment test on the candidates only
+    minx, miny, maxx, maxy = corridor_poly.bounds
+    cand_idx = np.flatnonzero((xs >= minx) & (xs <= maxx) & (ys >= miny) & (ys <= maxy))
+    within_mask = np.zeros(len(counties_alb), dtype=bool)
+    within_mask[cand_idx] = shapely.contains_xy(corridor_poly, xs[cand_idx], ys[cand_idx])
+    in_corr = counties_alb.iloc[within_mask]
+    print(f"Found {len(in_corr)} counties within the corridor")
+    return in_corr
+
+def build_birdcast_table(in_corr, state_map, state_fips_to_abbr):
+    """
+    Tidy the corridor counties and build their BirdCast county URLs
+
+    Args:
+        in_corr: GeoDataFrame of the counties inside the corridor
+        state_map: Dict of state FIPS code -> state name
+        state_fips_to_abbr: Dict of state FIPS code -> USPS state abbreviation
+
+    Returns:
+        DataFrame with state, county, FIPS and birdcast_url columns, sorted by state and county
+    """
+    out = in_corr[["STATEFP","COUNTYFP","GEOID","NAME"]].copy()
+    # Map state FIPS via the (few) categories rather than per-row dict lookups;
+    # materialize as plain strings so sorting stays alphabetical
+    statefp_cat = pd.Categorical(out["STATEFP"])
+    out["state"]  = np.asarray(statefp_cat.rename_categories(state_map))
+    out["state_abbr"] = np.asarray(statefp_cat.rename_categories(state_fips_to_abbr))
+    out.rename(columns={"NAME":"county"}, inplace=True)
+    out = out.sort_values(["state","county"])
+
+    # --- Build BirdCast county URLs ---
+    out["county_fips3"] = np.char.zfill(out["COUNTYFP"].to_numpy().astype("U3"), 3)
+    abbr = out["state_abbr"].to_numpy()
+    fips = out["county_fips3"].to_numpy()
+    out["birdcast_url"] = [
+        f"https://dashboard.birdcast.info/region/US-{a}-{f}" for a, f in zip(abbr, fips)
+    ]
+    return out
+
+def save_corridor_outputs(out, in_corr, output_prefix, buffer_km):
+    """
+    Save the corridor county tables and GeoJSON, then print a compact summary
+
+    Args:
+        out: DataFrame returned by build_birdcast_table
+        in_corr: GeoDataFrame of the counties inside the corridor
+        output_prefix: File name prefix (e.g., 'atlantic_flyway_corridor')
+        buffer_km: Corridor half-width in kilometers (for the summary)
+    """
+    # Reorder and save
+    print("Saving results...")
+    out[URL_COLUMNS].to_csv(f"{output_prefix}_counties_with_urls.csv", index=False)
+    # Columnar copy for analysis; the scrapers keep reading the CSV
+    out[URL_COLUMNS].to_parquet(
+        f"{output_prefix}_counties_with_urls.parquet",
+        engine="pyarrow", compression="zstd", index=False
+    )
+
+    # Save original format and GeoJSON too (back to WGS84 for the GeoJSON only)
+    out.to_csv(f"{output_prefix}_counties.csv", index=False)
+    in_corr[["GEOID","geometry"]].to_crs(4326).to_file(
+        f"{output_prefix}_counties.geojson", driver="GeoJSON", engine="pyogrio"
+    )
+    print("Files saved successfully!")
+
+    # Print a compact summary
+    print(f"Corridor width: ±{buffer_km} km; Total counties: {len(out)}\n")
+    print(out.groupby("state")["county"].count().sort_values(ascending=False))
+    print("\nSample with BirdCast URLs:")
+    print(out[URL_COLUMNS].head(10))
+
+def process_flyway(counties, flyway_name, output_prefix, spine_ll, buffer_km,
+                   statefps, state_map, state_fips_to_abbr):
+    """
+    Run the full corridor selection for one flyway and save its outputs
+
+    Args:
+        counties: GeoDataFrame returned by load_counties (not modified)
+        flyway_name: Name of the flyway (e.g., 'Atlantic')
+        output_prefix: File name prefix for the saved outputs
+        spine_ll: LineString tracing the corridor in lon/lat
+        buffer_km: Corridor half-width in kilometers
+        statefps: Iterable of 2-digit state FIPS codes in/near the corridor
+        state_map: Dict of state FIPS code -> state name
+        state_fips_to_abbr: Dict of state FIPS code -> USPS state abbreviation
+    """
+    start = time.perf_counter()
+    counties = filter_to_states(counties, statefps, flyway_name)
+    in_corr = select_corridor_counties(counties, spine_ll, buffer_km)
+    print(f"Corridor selection took {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    out = build_birdcast_table(in_corr, state_map, state_fips_to_abbr)
+    save_corridor_outputs(out, in_corr, output_prefix, buffer_km)
+    print(f"Building and saving outputs took {time.perf_counter() - start:.2f}s")
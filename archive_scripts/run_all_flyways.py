@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Run all flyway corridor selections
+Loads the US counties once and runs the Atlantic, Mississippi and Pacific corridor selections on it in parallel
+"""
+
+import os
+import sys
+import importlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import geopandas as gpd
+
+# Add the archive_scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import corridor_utils
+import atlantic_flyway_corridor
+import mississippi_flyway_corridor
+import pacific_flyway_corridor
+
+FLYWAYS = [
+    atlantic_flyway_corridor,
+    mississippi_flyway_corridor,
+    pacific_flyway_corridor,
+]
+
+# Counties frame loaded once per worker process by _init_worker
+_counties = None
+
+def _init_worker(feather_path):
+    """Load the shared counties frame in a worker (avoids pickling GEOS geometries per task)"""
+    global _counties
+    _counties = gpd.read_feather(feather_path)
+
+def _run_flyway(module_name):
+    """Run one flyway corridor selection on the worker's counties frame"""
+    flyway = importlib.import_module(module_name)
+    print(f"\n=== {flyway.FLYWAY_NAME} Flyway ===")
+    flyway.main(_counties)
+    return flyway.FLYWAY_NAME
+
+def main():
+    """Load counties once and run every flyway corridor selection on them in parallel"""
+    counties = corridor_utils.load_counties()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        feather_path = os.path.join(tmp_dir, "counties.feather")
+        counties.to_feather(feather_path)
+
+        with ProcessPoolExecutor(
+            max_workers=len(FLYWAYS),
+            initializer=_init_worker,
+            initargs=(feather_path,)
+        ) as executor:
+            for flyway_name in executor.map(_run_flyway, [f.__name__ for f in FLYWAYS]):
+                print(f"{flyway_name} Flyway corridor complete")
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,9 @@ Atlantic Flyway BirdCast Data Scraper
 Scrapes migration data from the BirdCast dashboard for all counties along the Atlantic Flyway corridor
 """
 
-import schedule
 from datetime import datetime
 import sys
 import os
-import time
 
 # Add the scripts directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -32,18 +30,20 @@ class AtlanticFlywayBirdCastScraper:
     
     def scrape_data(self):
         """Scrape migration data from all Atlantic Flyway counties"""
-        return scraper_utils.scrape_data(self.session, self.urls, "Atlantic Flyway")
+        return scraper_utils.scrape_data(
+            self.session, self.urls, "Atlantic Flyway", cache_dir=scraper_utils.CACHE_DIR
+        )
     
     def save_to_parquet(self, data_list, filename=None):
-        """Save data to Parquet file (append with deduplication)"""
+        """Save data to Parquet dataset (append-only, deduplicated on load)"""
         if filename is None:
             filename = f"{scraper_utils.DATA_DIR}/atlantic_flyway_corridor.parquet"
         scraper_utils.save_to_parquet(data_list, filename)
 
     def save_to_json(self, data_list, filename=None):
-        """Save data to JSON file (append to list) - DEPRECATED: Use save_to_parquet instead"""
+        """Save data to JSON Lines file (append-only) - DEPRECATED: Use save_to_parquet instead"""
         if filename is None:
-            filename = f"{scraper_utils.DATA_DIR}/atlantic_flyway_corridor.json"
+            filename = f"{scraper_utils.DATA_DIR}/atlantic_flyway_corridor.jsonl"
         scraper_utils.save_to_json(data_list, filename)
 
 def run_flyway_scraper():
@@ -62,23 +62,10 @@ def run_flyway_scraper():
         print("No data was collected. Check the logs for details.")
         logger.error("Atlantic Flyway scraping failed")
 
-def schedule_daily_scraping():
-    """Schedule the Atlantic Flyway scraper to run daily at 1:00 PM"""
-    schedule.every().day.at("13:00").do(run_flyway_scraper)
-    
-    print("Atlantic Flyway scraper scheduled to run daily at 1:00 PM")
-    print("Press Ctrl+C to stop the scheduler")
-    
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--schedule":
-        schedule_daily_scraping()
-    elif len(sys.argv) > 1 and sys.argv[1] == "--test":
+    if len(sys.argv) > 1 and sys.argv[1] == "--test":
         print("Running test scrape of Atlantic Flyway counties...")
         run_flyway_scraper()
     else:
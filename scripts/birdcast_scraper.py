@@ -4,11 +4,9 @@ BirdCast Data Scraper
 Scrapes migration data from the BirdCast dashboard for multiple counties: Duval County FL, Boulder County CO, Essex County NJ, Contra Costa County CA, and Lee County AL
 """
 
-import schedule
 from datetime import datetime
 import sys
 import os
-import time
 
 # Add the scripts directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -33,7 +31,9 @@ class BirdCastScraper:
     
     def scrape_data(self):
         """Scrape migration data from all configured BirdCast dashboard URLs"""
-        return scraper_utils.scrape_data(self.session, self.urls, "BirdCast")
+        return scraper_utils.scrape_data(
+            self.session, self.urls, "BirdCast", cache_dir=scraper_utils.CACHE_DIR
+        )
     
     def save_to_csv(self, data_list, filename=None):
         """Save data to CSV file"""
@@ -42,15 +42,15 @@ class BirdCastScraper:
         scraper_utils.save_to_csv(data_list, filename)
     
     def save_to_parquet(self, data_list, filename=None):
-        """Save data to Parquet file (append with deduplication)"""
+        """Save data to Parquet dataset (append-only, deduplicated on load)"""
         if filename is None:
             filename = f"{scraper_utils.DATA_DIR}/birdcast_data.parquet"
         scraper_utils.save_to_parquet(data_list, filename)
 
     def save_to_json(self, data_list, filename=None):
-        """Save data to JSON file (append to list) - DEPRECATED: Use save_to_parquet instead"""
+        """Save data to JSON Lines file (append-only) - DEPRECATED: Use save_to_parquet instead"""
         if filename is None:
-            filename = f"{scraper_utils.DATA_DIR}/birdcast_data.json"
+            filename = f"{scraper_utils.DATA_DIR}/birdcast_data.jsonl"
         scraper_utils.save_to_json(data_list, filename)
 
 def run_scraper():
@@ -70,23 +70,10 @@ def run_scraper():
         print("No data was collected. Check the logs for details.")
         logger.error("Scraping failed")
 
-def schedule_daily_scraping():
-    """Schedule the scraper to run daily at 12:00 PM (noon)"""
-    schedule.every().day.at("12:00").do(run_scraper)
-    
-    print("BirdCast scraper scheduled to run daily at 12:00 PM")
-    print("Press Ctrl+C to stop the scheduler")
-    
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--schedule":
-        schedule_daily_scraping()
-    elif len(sys.argv) > 1 and sys.argv[1] == "--test":
+    if len(sys.argv) > 1 and sys.argv[1] == "--test":
         print("Running test scrape...")
         run_scraper()
     else:
@@ -3,13 +3,17 @@
 Convert existing JSON data files to Parquet format with deduplication
 """
 
-import json
 import pandas as pd
 import os
+import sys
 from pathlib import Path
 import logging
 from datetime import datetime
 
+# Add the scripts directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import scraper_utils
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,23 +22,28 @@ logging.basicConfig(
 
 def convert_json_to_parquet(json_file_path, parquet_file_path):
     """
-    Convert JSON file to Parquet format with deduplication
+    Convert JSON / JSON Lines file(s) to Parquet format with deduplication
     
     Args:
-        json_file_path: Path to the JSON file
-        parquet_file_path: Path where the Parquet file should be saved
+        json_file_path: Path to the JSON or JSON Lines file, or a list of such paths
+            whose records are combined (e.g. a legacy .json history plus its .jsonl)
+        parquet_file_path: Path of the Parquet dataset the records are added to
+            (created if needed; an existing single-file history is moved into it)
     
     Returns:
         tuple: (success: bool, records_processed: int, duplicates_removed: int)
     """
     try:
-        if not os.path.exists(json_file_path):
+        json_paths = json_file_path if isinstance(json_file_path, (list, tuple)) else [json_file_path]
+        json_paths = [path for path in json_paths if os.path.exists(path)]
+        if not json_paths:
             logging.warning(f"JSON file not found: {json_file_path}")
             return False, 0, 0
         
         # Load JSON data
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = []
+        for path in json_paths:
+            data.extend(scraper_utils.load_json_records(path))
         
         if not data:
             logging.warning(f"No data found in {json_file_path}")
@@ -47,24 +56,27 @@ def convert_json_to_parquet(json_file_path, parquet_file_path):
         # Remove duplicates based on scrape_timestamp and region_code
         # Keep the most recent entry for each region_code + date combination
         if 'scrape_timestamp' in df.columns and 'region_code' in df.columns:
-            # Convert scrape_timestamp to datetime for proper sorting
-            df['scrape_timestamp_dt'] = pd.to_datetime(df['scrape_timestamp'])
-            
-            # Sort by timestamp (most recent first) then drop duplicates
-            df_sorted = df.sort_values('scrape_timestamp_dt', ascending=False)
+            # Convert scrape_timestamp to datetime for finding the most recent entry
+            # (the scraper always writes ISO 8601, so skip per-row format inference)
+            df['scrape_timestamp_dt'] = pd.to_datetime(
+                df['scrape_timestamp'], format='ISO8601', cache=True, utc=True
+            )
             
             # For deduplication, we'll keep the most recent entry per region per day
             # Extract date from migration_date or scrape_timestamp
             if 'migration_date' in df.columns:
-                df_sorted['date_key'] = df_sorted['migration_date']
+                df['date_key'] = df['migration_date']
             else:
-                df_sorted['date_key'] = df_sorted['scrape_timestamp_dt'].dt.date
+                df['date_key'] = df['scrape_timestamp_dt'].dt.date
             
-            # Drop duplicates keeping first (most recent due to sorting)
-            df_dedup = df_sorted.drop_duplicates(
-                subset=['region_code', 'date_key'], 
-                keep='first'
-            )
+            # Pick the row with the latest timestamp in each region/date group
+            # (one O(N) groupby pass instead of sorting the whole frame)
+            group_keys = [
+                df['region_code'].astype('category'),
+                df['date_key'].astype('category')
+            ]
+            idx = df.groupby(group_keys, observed=True, dropna=False)['scrape_timestamp_dt'].idxmax()
+            df_dedup = df.loc[idx]
             
             # Remove the helper columns
             df_dedup = df_dedup.drop(['scrape_timestamp_dt', 'date_key'], axis=1)
@@ -75,16 +87,13 @@ def convert_json_to_parquet(json_file_path, parquet_file_path):
         final_count = len(df_dedup)
         duplicates_removed = original_count - final_count
         
-        # Optimize data types for better compression
-        for col in df_dedup.columns:
-            if col in ['total_birds', 'peak_birds_in_flight', 'flight_speed_mph', 'flight_altitude_ft']:
-                df_dedup[col] = pd.to_numeric(df_dedup[col], errors='coerce').astype('Int64')
-        
-        # Save to Parquet with compression
-        df_dedup.to_parquet(
-            parquet_file_path, 
-            compression='snappy',
-            index=False
+        # Add the records to the scraper's Parquet dataset as new files, typed with
+        # its schema (zstd + dictionary encoding suits the highly repetitive
+        # region/direction/date columns); load_parquet deduplicates them against
+        # the scraped history
+        records = df_dedup.astype(object).where(df_dedup.notna(), None).to_dict('records')
+        scraper_utils.append_to_parquet(
+            records, str(parquet_file_path), compression='zstd', compression_level=3
         )
         
         logging.info(f"Converted {json_file_path} to {parquet_file_path}")
@@ -102,14 +111,15 @@ def main():
     """Convert all existing JSON files to Parquet format"""
     
     # Define the data directory
-    data_dir = Path("/Users/davidjcox/Library/CloudStorage/Dropbox/Miscellaneous/birdcast-data-grabber/data")
+    data_dir = Path(scraper_utils.DATA_DIR)
     
-    # Define JSON to Parquet mappings
+    # Define JSON to Parquet mappings (the legacy .json history and the
+    # append-only .jsonl file of each scraper are converted together)
     conversions = [
-        ("birdcast_data.json", "birdcast_data.parquet"),
-        ("atlantic_flyway_corridor.json", "atlantic_flyway_corridor.parquet"),
-        ("mississippi_flyway_corridor.json", "mississippi_flyway_corridor.parquet"),
-        ("pacific_flyway_corridor.json", "pacific_flyway_corridor.parquet")
+        ("birdcast_data", "birdcast_data.parquet"),
+        ("atlantic_flyway_corridor", "atlantic_flyway_corridor.parquet"),
+        ("mississippi_flyway_corridor", "mississippi_flyway_corridor.parquet"),
+        ("pacific_flyway_corridor", "pacific_flyway_corridor.parquet")
     ]
     
     total_processed = 0
@@ -118,11 +128,11 @@ def main():
     
     logging.info("Starting JSON to Parquet conversion...")
     
-    for json_filename, parquet_filename in conversions:
-        json_path = data_dir / json_filename
+    for json_basename, parquet_filename in conversions:
+        json_paths = [data_dir / f"{json_basename}.json", data_dir / f"{json_basename}.jsonl"]
         parquet_path = data_dir / parquet_filename
         
-        success, records, duplicates = convert_json_to_parquet(json_path, parquet_path)
+        success, records, duplicates = convert_json_to_parquet(json_paths, parquet_path)
         
         if success:
             successful_conversions += 1
@@ -4,11 +4,9 @@ Mississippi Flyway BirdCast Data Scraper
 Scrapes migration data from the BirdCast dashboard for all counties along the Mississippi Flyway corridor
 """
 
-import schedule
 from datetime import datetime
 import sys
 import os
-import time
 
 # Add the scripts directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -32,18 +30,20 @@ class MississippiFlywayBirdCastScraper:
     
     def scrape_data(self):
         """Scrape migration data from all Mississippi Flyway counties"""
-        return scraper_utils.scrape_data(self.session, self.urls, "Mississippi Flyway")
+        return scraper_utils.scrape_data(
+            self.session, self.urls, "Mississippi Flyway", cache_dir=scraper_utils.CACHE_DIR
+        )
     
     def save_to_parquet(self, data_list, filename=None):
-        """Save data to Parquet file (append with deduplication)"""
+        """Save data to Parquet dataset (append-only, deduplicated on load)"""
         if filename is None:
             filename = f"{scraper_utils.DATA_DIR}/mississippi_flyway_corridor.parquet"
         scraper_utils.save_to_parquet(data_list, filename)
 
     def save_to_json(self, data_list, filename=None):
-        """Save data to JSON file (append to list) - DEPRECATED: Use save_to_parquet instead"""
+        """Save data to JSON Lines file (append-only) - DEPRECATED: Use save_to_parquet instead"""
         if filename is None:
-            filename = f"{scraper_utils.DATA_DIR}/mississippi_flyway_corridor.json"
+            filename = f"{scraper_utils.DATA_DIR}/mississippi_flyway_corridor.jsonl"
         scraper_utils.save_to_json(data_list, filename)
 
 def run_flyway_scraper():
@@ -62,23 +62,10 @@ def run_flyway_scraper():
         print("No data was collected. Check the logs for details.")
         logger.error("Mississippi Flyway scraping failed")
 
-def schedule_daily_scraping():
-    """Schedule the Mississippi Flyway scraper to run daily at 2:00 PM"""
-    schedule.every().day.at("14:00").do(run_flyway_scraper)
-    
-    print("Mississippi Flyway scraper scheduled to run daily at 2:00 PM")
-    print("Press Ctrl+C to stop the scheduler")
-    
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--schedule":
-        schedule_daily_scraping()
-    elif len(sys.argv) > 1 and sys.argv[1] == "--test":
+    if len(sys.argv) > 1 and sys.argv[1] == "--test":
         print("Running test scrape of Mississippi Flyway counties...")
         run_flyway_scraper()
     else:
@@ -5,22 +5,132 @@ Common functionality shared across all BirdCast scraper classes
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+import orjson
 import csv
+import gzip
+import hashlib
 import os
+import shutil
 import pandas as pd
-from datetime import datetime, timezone
+import pyarrow as pa
+import pyarrow.dataset as ds
+from datetime import datetime, timezone, timedelta
 import re
+import sqlite3
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from collections import Counter
+from contextlib import closing
+from dataclasses import dataclass, fields, asdict
+from typing import Optional
+from urllib.parse import urlsplit
+from functools import lru_cache
 from dateutil import parser as date_parser
-import pytz
 
-# Base paths for the project
-BASE_DIR = "/Users/davidjcox/Library/CloudStorage/Dropbox/Miscellaneous/birdcast-data-grabber"
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LOGS_DIR = os.path.join(BASE_DIR, "logs")
+# Base paths for the project (the repository root unless overridden in the environment,
+# e.g. to point a container or another machine at its own data/log directories)
+BASE_DIR = os.environ.get(
+    "BIRDCAST_BASE_DIR", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+DATA_DIR = os.environ.get("BIRDCAST_DATA_DIR", os.path.join(BASE_DIR, "data"))
+LOGS_DIR = os.environ.get("BIRDCAST_LOGS_DIR", os.path.join(BASE_DIR, "logs"))
+# Optional same-day cache of fetched pages (see scrape_single_url); off unless set
+CACHE_DIR = os.environ.get("BIRDCAST_CACHE_DIR") or None
+
+# Regex patterns for scrape_single_url, compiled once at import.
+# Each field keeps its own pattern on purpose: fusing them into one named-group
+# alternation scanned with a single finditer pass measured ~2.5x slower on a 200 KB
+# page (the fused pattern loses re's literal-prefix search), and a consuming
+# alternation lets the greedy 'Birds crossed.*last night' swallow the other fields
+# whenever the page text comes back as a single line. A re.Scanner tokenizer over the
+# page was slower still (~2.8x), since it needs a catch-all token dispatched per word.
+# Patterns that can start inside a run of digits/letters are guarded with a lookbehind
+# so a long run is tried once from its start instead of from every offset, and the
+# region name is capped at 200 characters, keeping worst-case pages linear.
+# The bird count patterns are written in lowercase and run against the page text
+# lowercased once, which is cheaper than case-insensitive matching for each pattern.
+_REGION_RE = re.compile(r'/region/([^/]+)$')
+_REGION_NAME_RE = re.compile(r'Migration Dashboard\s+([A-Za-z][A-Za-z\s,]{0,200}?)(?=\s+Search|$)')
+_BIRDS_CROSSED_RE = re.compile(r'(?<!\d)(\d{1,3}(?:,?\d{3})*)\s+birds crossed.*last night')
+_PEAK_OLD_RE = re.compile(r'peak of (\d{1,3}(?:,?\d{3})*) birds in flight')
+_PEAK_NEW_RE = re.compile(r'peak migration traffic:\s*(\d{1,3}(?:,?\d{3})*)\s*birds in flight')
+_PEAK_EST_RE = re.compile(r'(?<!\d)(\d{1,3}(?:,?\d{3})*)\s*birds in flight \(est\.\)')
+_DIRECTION_OLD_RE = re.compile(r'flying ([A-Z]{1,3})')
+_DIRECTION_NEW_RE = re.compile(r'Direction:\s*([A-Z]{1,3})')
+_SPEED_OLD_RE = re.compile(r'at (\d+) mph')
+_SPEED_NEW_RE = re.compile(r'Speed:\s*(\d+)\s*mph')
+_ALTITUDE_OLD_RE = re.compile(r'at (\d{1,3}(?:,?\d{3})*) feet')
+_ALTITUDE_NEW_RE = re.compile(r'Altitude:\s*(\d{1,3}(?:,?\d{3})*)\s*ft?')
+_DATETIME_RE = re.compile(r'([A-Za-z]{3}, [A-Za-z]{3} \d{1,2}, \d{4}, \d{1,2}:\d{2} [AP]M [A-Z]{3})')  # e.g. "Fri, Oct 24, 2025, 6:00 PM EDT"
+_MIGRATION_DATE_RE = re.compile(r'(?<![A-Za-z])([A-Za-z]+ night, [A-Za-z]+ \d{1,2})')  # e.g. "Friday night, Oct 24"
+
+@dataclass(slots=True)
+class BirdCastRecord:
+    """One scrape of one BirdCast region page (fields in output column order)"""
+    scrape_timestamp: str
+    url: str
+    region_code: Optional[str] = None
+    region_name: Optional[str] = None
+    total_birds: Optional[int] = None
+    peak_birds_in_flight: Optional[int] = None
+    flight_direction: Optional[str] = None
+    flight_speed_mph: Optional[int] = None
+    flight_altitude_ft: Optional[int] = None
+    migration_start_raw: Optional[str] = None
+    migration_start_utc: Optional[str] = None
+    migration_end_raw: Optional[str] = None
+    migration_end_utc: Optional[str] = None
+    migration_date: Optional[str] = None
+
+# Consistent column order for BirdCast CSV output
+CSV_FIELDNAMES = tuple(field.name for field in fields(BirdCastRecord))
+
+# Column types of the Parquet datasets written by save_to_parquet
+PARQUET_SCHEMA = pa.schema([
+    ('scrape_timestamp', pa.timestamp('ns', tz='UTC')),
+    ('url', pa.string()),
+    ('region_code', pa.string()),
+    ('region_name', pa.string()),
+    ('total_birds', pa.int64()),
+    ('peak_birds_in_flight', pa.int64()),
+    ('flight_direction', pa.string()),
+    ('flight_speed_mph', pa.int64()),
+    ('flight_altitude_ft', pa.int64()),
+    ('migration_start_raw', pa.string()),
+    ('migration_start_utc', pa.timestamp('ns', tz='UTC')),
+    ('migration_end_raw', pa.string()),
+    ('migration_end_utc', pa.timestamp('ns', tz='UTC')),
+    ('migration_date', pa.string()),
+])
+
+# Each save adds one file per scrape date under <dataset>/scrape_date=YYYY-MM-DD/
+_PARQUET_PARTITIONING = ds.partitioning(pa.schema([('scrape_date', pa.string())]), flavor='hive')
+
+# SQLite index of the latest record per region and day, kept inside each dataset
+# (the '_' prefix keeps it out of the dataset's file discovery)
+_RECORD_INDEX_FILENAME = '_latest_records.sqlite'
+
+# BirdCast datetime layout (without the trailing time zone) and the UTC offsets
+# of the US time zone abbreviations it shows
+_BIRDCAST_DATETIME_FORMAT = '%a, %b %d, %Y, %I:%M %p'
+_TZ_OFFSETS = {
+    abbr: timezone(timedelta(hours=hours))
+    for abbr, hours in {
+        'UTC': 0, 'GMT': 0,
+        'EST': -5, 'EDT': -4,
+        'CST': -6, 'CDT': -5,
+        'MST': -7, 'MDT': -6,
+        'PST': -8, 'PDT': -7,
+        'AKST': -9, 'AKDT': -8,
+        'HST': -10,
+    }.items()
+}
 
 def setup_logging(log_filename):
     """
@@ -32,6 +142,7 @@ def setup_logging(log_filename):
     Returns:
         Configured logger
     """
+    os.makedirs(LOGS_DIR, exist_ok=True)
     log_path = os.path.join(LOGS_DIR, log_filename)
     
     logging.basicConfig(
@@ -47,15 +158,24 @@ def setup_logging(log_filename):
 
 def create_session():
     """
-    Create a requests session with appropriate headers
+    Create a requests session with appropriate headers, a keep-alive
+    connection pool sized for concurrent scraping and retries on transient errors
     
     Returns:
         Configured requests.Session object
     """
     session = requests.Session()
     session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml'
     })
+    
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
     return session
 
 def parse_datetime_string(datetime_str):
@@ -71,18 +191,40 @@ def parse_datetime_string(datetime_str):
     if not datetime_str:
         return datetime_str
     
+    # Remove extra whitespace and normalize (also gives the cache a canonical key)
+    return _parse_normalized_datetime(' '.join(datetime_str.split()))
+
+@lru_cache(maxsize=4096)
+def _parse_normalized_datetime(datetime_str):
+    """
+    Parse a whitespace-normalized BirdCast datetime string (cached - the same
+    start/end times repeat across every region scraped on a given day)
+    
+    Args:
+        datetime_str: Datetime string with whitespace already normalized
+        
+    Returns:
+        ISO formatted UTC datetime string or original string if parsing fails
+    """
     try:
-        # Remove extra whitespace and normalize
-        datetime_str = ' '.join(datetime_str.split())
+        # Fast path for the usual BirdCast format, e.g. "Fri, Oct 24, 2025, 6:00 PM EDT"
+        naive_str, _, tz_abbr = datetime_str.rpartition(' ')
+        tz = _TZ_OFFSETS.get(tz_abbr)
+        if tz is not None:
+            try:
+                parsed_dt = datetime.strptime(naive_str, _BIRDCAST_DATETIME_FORMAT).replace(tzinfo=tz)
+                return parsed_dt.astimezone(timezone.utc).isoformat()
+            except ValueError:
+                pass  # Not the usual format - fall back to dateutil
         
         # Parse the datetime string
-        parsed_dt = date_parser.parse(datetime_str)
+        parsed_dt = date_parser.parse(datetime_str, tzinfos=_TZ_OFFSETS)
         
         # Convert to UTC if timezone aware, otherwise assume UTC
         if parsed_dt.tzinfo is not None:
-            utc_dt = parsed_dt.astimezone(pytz.UTC)
+            utc_dt = parsed_dt.astimezone(timezone.utc)
         else:
-            utc_dt = pytz.UTC.localize(parsed_dt)
+            utc_dt = parsed_dt.replace(tzinfo=timezone.utc)
         
         return utc_dt.isoformat()
         
@@ -90,139 +232,226 @@ def parse_datetime_string(datetime_str):
         logging.warning(f"Could not parse datetime string '{datetime_str}': {e}")
         return datetime_str  # Return original string if parsing fails
 
-def scrape_single_url(session, url):
+def _intc(number_str):
+    """int() of a count that may contain thousands separators (e.g. '134,500')"""
+    return int(number_str.replace(',', '')) if ',' in number_str else int(number_str)
+
+@lru_cache(maxsize=None)
+def _region_code_from_url(url):
+    """Region code (e.g. 'US-FL-031') at the end of a BirdCast region URL, or None"""
+    region_match = _REGION_RE.search(url)
+    return region_match.group(1) if region_match else None
+
+def _html_cache_path(cache_dir, url):
+    """Path of the gzipped copy of today's page for url in cache_dir (one file per URL per UTC day)"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}-{datetime.now(timezone.utc):%Y%m%d}.html.gz")
+
+def _prune_html_cache(cache_dir):
+    """Delete cached pages (and partial downloads) from earlier days - they are never read again"""
+    if not os.path.isdir(cache_dir):
+        return
+    today_suffix = f"-{datetime.now(timezone.utc):%Y%m%d}.html.gz"
+    removed = 0
+    for name in os.listdir(cache_dir):
+        # Today's .part files may belong to another scraper still downloading
+        if name.endswith(('.html.gz', '.html.gz.part')) and today_suffix not in name:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+                removed += 1
+            except OSError as e:
+                logging.warning(f"Could not remove stale cache file {name}: {e}")
+    if removed:
+        logging.info(f"Removed {removed} stale page(s) from cache {cache_dir}")
+
+def _tee_to_cache(chunks, cache_path, encoding):
+    """
+    Yield the page chunks unchanged while writing them to a gzipped cache file
+    (first line holds the response encoding; the file is kept only if the page was read to the end)
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + '.part'
+    complete = False
+    try:
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write((encoding or '').encode('ascii') + b'\n')
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+        complete = True
+    finally:
+        if complete:
+            os.replace(tmp_path, cache_path)
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _parse_html_chunks(chunks, encoding):
+    """
+    Parse a page from an iterable of byte chunks with lxml, feeding them as they arrive
+    
+    Args:
+        chunks: Iterable of bytes
+        encoding: Page encoding (None lets lxml detect it)
+        
+    Returns:
+        lxml root element, or None if the content is CSS instead of HTML
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding)
+    chunks = iter(chunks)
+    first_chunk = next(chunks, b'')
+    
+    # Check if we got CSS instead of HTML (on the raw bytes of the page start -
+    # the markers are ASCII, so no decoding is needed)
+    if (first_chunk[:4096].lstrip().startswith(b'@keyframes')
+            or b'css' in first_chunk[:100].lower()):
+        logging.error("Received CSS content instead of HTML - the URL might be incorrect")
+        return None
+    
+    parser.feed(first_chunk)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+def scrape_single_url(session, url, cache_dir=None):
     """
     Scrape migration data from a single BirdCast dashboard URL
     
     Args:
         session: requests.Session object
         url: BirdCast dashboard URL to scrape
+        cache_dir: Optional directory of gzipped page copies; a page already fetched
+            today is read from there instead of the network (for same-day reruns)
         
     Returns:
-        Dictionary containing scraped data or None if scraping failed
+        BirdCastRecord of the scraped data or None if scraping failed
     """
     try:
-        logging.info(f"Scraping data from {url}")
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Check if we're getting actual HTML content or just CSS
-        content_type = response.headers.get('content-type', '').lower()
-        if 'text/html' not in content_type:
-            logging.error(f"Unexpected content type: {content_type}")
-            return None
+        cache_path = _html_cache_path(cache_dir, url) if cache_dir else None
         
-        html_content = response.text
+        if cache_path and os.path.isfile(cache_path):
+            logging.info(f"Scraping data from cached copy of {url}")
+            with gzip.open(cache_path, 'rb') as f:
+                encoding = f.readline().strip().decode('ascii') or None
+                tree = _parse_html_chunks(iter(lambda: f.read(16384), b''), encoding)
+        else:
+            logging.info(f"Scraping data from {url}")
+            # Stream so the body is only downloaded once the headers say it is HTML
+            with session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # Check if we're getting actual HTML content or just CSS
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    logging.error(f"Unexpected content type: {content_type}")
+                    return None
+                
+                # Feed the body to lxml chunk by chunk as it arrives instead of buffering
+                # and decoding the whole page first (same encoding response.text would use)
+                chunks = response.iter_content(chunk_size=16384)
+                if cache_path:
+                    chunks = _tee_to_cache(chunks, cache_path, response.encoding)
+                tree = _parse_html_chunks(chunks, response.encoding)
         
-        # Check if we got CSS instead of HTML
-        if html_content.strip().startswith('@keyframes') or 'css' in html_content[:100].lower():
-            logging.error("Received CSS content instead of HTML - the URL might be incorrect")
+        if tree is None:
             return None
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Extract data - initialize with all expected fields
-        data = {
-            'scrape_timestamp': datetime.now(timezone.utc).isoformat(),
-            'url': url,
-            'region_code': None,
-            'region_name': None,
-            'total_birds': None,
-            'peak_birds_in_flight': None,
-            'flight_direction': None,
-            'flight_speed_mph': None,
-            'flight_altitude_ft': None,
-            'migration_start_raw': None,
-            'migration_start_utc': None,
-            'migration_end_raw': None,
-            'migration_end_utc': None,
-            'migration_date': None
-        }
+        # Drop <script>/<style>/<template> subtrees (never visible page text) so the
+        # regexes below only scan the rendered text
+        etree.strip_elements(tree, 'script', 'style', 'template', with_tail=False)
+        
+        # Extract data - all other fields default to None
+        data = BirdCastRecord(
+            scrape_timestamp=datetime.now(timezone.utc).isoformat(),
+            url=url
+        )
         
         # Extract region name from URL and page content
-        region_match = re.search(r'/region/([^/]+)$', url)
-        if region_match:
-            data['region_code'] = region_match.group(1)
+        data.region_code = _region_code_from_url(url)
         
         # Try to find region name in the page content
-        text_content = soup.get_text()
-        region_name_match = re.search(r'Migration Dashboard\s+([A-Za-z\s,]+?)(?:\s+Search|$)', text_content)
+        text_content = tree.text_content()
+        region_name_match = _REGION_NAME_RE.search(text_content)
         if region_name_match:
-            data['region_name'] = region_name_match.group(1).strip()
+            data.region_name = region_name_match.group(1).strip()
+        
+        # All the bird count patterns contain "birds" - pages without any migration
+        # data (e.g. "No migration data found") skip those four scans
+        text_lower = text_content.lower()
+        has_bird_counts = 'birds' in text_lower
         
         # Try to find "xxx Birds crossed" pattern
-        birds_crossed_match = re.search(r'(\d{1,3}(?:,?\d{3})*)\s+Birds crossed.*last night', text_content, re.IGNORECASE)
+        birds_crossed_match = has_bird_counts and _BIRDS_CROSSED_RE.search(text_lower)
         if birds_crossed_match:
-            total_birds_str = birds_crossed_match.group(1).replace(',', '')
+            total_birds_str = birds_crossed_match.group(1)
             try:
-                data['total_birds'] = int(total_birds_str)
+                data.total_birds = _intc(total_birds_str)
             except ValueError:
                 logging.warning(f"Could not parse total birds: {total_birds_str}")
         
         # Try to find "Peak of xxx birds in flight" pattern (old format)
-        peak_birds_match = re.search(r'Peak of (\d{1,3}(?:,?\d{3})*) birds in flight', text_content, re.IGNORECASE)
-        if not peak_birds_match:
+        peak_birds_match = has_bird_counts and _PEAK_OLD_RE.search(text_lower)
+        if has_bird_counts and not peak_birds_match:
             # Try new format: "PEAK MIGRATION TRAFFIC: 134,500 Birds in flight"
-            peak_birds_match = re.search(r'PEAK MIGRATION TRAFFIC:\s*(\d{1,3}(?:,?\d{3})*)\s*Birds in flight', text_content, re.IGNORECASE)
-        if not peak_birds_match:
+            peak_birds_match = _PEAK_NEW_RE.search(text_lower)
+        if has_bird_counts and not peak_birds_match:
             # Try alternative format: "134,500 Birds in flight (est.)"
-            peak_birds_match = re.search(r'(\d{1,3}(?:,?\d{3})*)\s*Birds in flight \(est\.\)', text_content, re.IGNORECASE)
+            peak_birds_match = _PEAK_EST_RE.search(text_lower)
         
         if peak_birds_match:
-            peak_birds_str = peak_birds_match.group(1).replace(',', '')
+            peak_birds_str = peak_birds_match.group(1)
             try:
-                data['peak_birds_in_flight'] = int(peak_birds_str)
+                data.peak_birds_in_flight = _intc(peak_birds_str)
             except ValueError:
                 logging.warning(f"Could not parse peak birds: {peak_birds_str}")
         
         # Try to find flight direction - multiple patterns
-        direction_match = re.search(r'flying ([A-Z]{1,3})', text_content)  # Old format
+        direction_match = _DIRECTION_OLD_RE.search(text_content)  # Old format
         if not direction_match:
-            direction_match = re.search(r'Direction:\s*([A-Z]{1,3})', text_content)  # New format
+            direction_match = _DIRECTION_NEW_RE.search(text_content)  # New format
         
         if direction_match:
-            data['flight_direction'] = direction_match.group(1)
+            data.flight_direction = direction_match.group(1)
         
         # Try to find flight speed - multiple patterns
-        speed_match = re.search(r'at (\d+) mph', text_content)  # Old format
+        speed_match = _SPEED_OLD_RE.search(text_content)  # Old format
         if not speed_match:
-            speed_match = re.search(r'Speed:\s*(\d+)\s*mph', text_content)  # New format
+            speed_match = _SPEED_NEW_RE.search(text_content)  # New format
         
         if speed_match:
             try:
-                data['flight_speed_mph'] = int(speed_match.group(1))
+                data.flight_speed_mph = int(speed_match.group(1))
             except ValueError:
                 logging.warning(f"Could not parse flight speed: {speed_match.group(1)}")
         
         # Try to find flight altitude - multiple patterns
-        altitude_match = re.search(r'at (\d{1,3}(?:,?\d{3})*) feet', text_content)  # Old format
+        altitude_match = _ALTITUDE_OLD_RE.search(text_content)  # Old format
         if not altitude_match:
-            altitude_match = re.search(r'Altitude:\s*(\d{1,3}(?:,?\d{3})*)\s*ft?', text_content)  # New format
+            altitude_match = _ALTITUDE_NEW_RE.search(text_content)  # New format
         
         if altitude_match:
-            altitude_str = altitude_match.group(1).replace(',', '')
+            altitude_str = altitude_match.group(1)
             try:
-                data['flight_altitude_ft'] = int(altitude_str)
+                data.flight_altitude_ft = _intc(altitude_str)
             except ValueError:
                 logging.warning(f"Could not parse flight altitude: {altitude_str}")
         
         # Try to find migration start and end times
         # Look for patterns like "Fri, Oct 24, 2025, 6:00 PM EDT"
-        time_patterns = re.findall(r'([A-Za-z]{3}, [A-Za-z]{3} \d{1,2}, \d{4}, \d{1,2}:\d{2} [AP]M [A-Z]{3})', text_content)
+        time_patterns = _DATETIME_RE.findall(text_content)
         
         if len(time_patterns) >= 2:
             # Usually the first is start time, second is end time
-            data['migration_start_raw'] = time_patterns[0]
-            data['migration_end_raw'] = time_patterns[1]
+            data.migration_start_raw = time_patterns[0]
+            data.migration_end_raw = time_patterns[1]
             
             # Parse to UTC
-            data['migration_start_utc'] = parse_datetime_string(time_patterns[0])
-            data['migration_end_utc'] = parse_datetime_string(time_patterns[1])
+            data.migration_start_utc = parse_datetime_string(time_patterns[0])
+            data.migration_end_utc = parse_datetime_string(time_patterns[1])
         
         # Try to find migration date (like "Friday night, Oct 24")
-        date_match = re.search(r'([A-Za-z]+ night, [A-Za-z]+ \d{1,2})', text_content)
+        date_match = _MIGRATION_DATE_RE.search(text_content)
         if date_match:
-            data['migration_date'] = date_match.group(1)
+            data.migration_date = date_match.group(1)
         
         logging.info(f"Successfully scraped data from {url}")
         return data
@@ -234,221 +463,556 @@ def scrape_single_url(session, url):
         logging.error(f"Error scraping {url}: {e}")
         return None
 
-def scrape_data(session, urls, scraper_name="BirdCast"):
+class _RequestPacer:
+    """
+    Token bucket shared by the worker threads: refills at `rate` requests per second
+    and holds up to `burst` tokens, so after an idle spell up to `burst` requests
+    start at once and the rest are spaced out to the average rate (burst=1 gives
+    evenly spaced starts). Workers wait only as long as needed instead of each
+    sleeping after every fetch.
+    """
+    
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Take a token even if none is left yet; a negative balance reserves
+            # a slot behind the callers already waiting
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+def scrape_data(session, urls, scraper_name="BirdCast", max_workers=8, requests_per_second=2.0,
+                cache_dir=None, burst=1):
     """
-    Scrape migration data from multiple URLs
+    Scrape migration data from multiple URLs concurrently
     
     Args:
-        session: requests.Session object
+        session: requests.Session object (shared by all worker threads)
         urls: List of URLs to scrape
         scraper_name: Name of the scraper for logging
+        max_workers: Maximum number of URLs fetched at the same time
+        requests_per_second: Request rate limit per host, to be respectful to the server
+            (the default matches the old serial loop's 0.5 s delay between requests)
+        cache_dir: Optional directory for same-day page copies (see scrape_single_url)
+        burst: Number of requests to a host that may start back to back after an idle spell
         
     Returns:
-        List of scraped data dictionaries
+        List of BirdCastRecords for the URLs scraped successfully (in the same order as urls)
     """
-    all_data = []
-    
     logging.info(f"Starting to scrape {len(urls)} {scraper_name} URLs...")
     
-    for url in urls:
-        data = scrape_single_url(session, url)
-        if data:
-            all_data.append(data)
-        
-        # Add a small delay to be respectful to the server
-        time.sleep(0.5)
+    if cache_dir:
+        _prune_html_cache(cache_dir)
+    
+    # One bucket per host, so the rate limit applies to each server separately
+    pacers = {
+        host: _RequestPacer(requests_per_second, burst)
+        for host in {urlsplit(url).netloc for url in urls}
+    }
+    
+    def scrape_paced(url):
+        if not (cache_dir and os.path.isfile(_html_cache_path(cache_dir, url))):
+            pacers[urlsplit(url).netloc].wait()
+        return scrape_single_url(session, url, cache_dir)
+    
+    # Network waits dominate, so overlap them across a pool of threads
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        results = list(executor.map(scrape_paced, urls))
+    
+    all_data = [data for data in results if data]
     
     logging.info(f"Completed scraping. Successfully collected data from {len(all_data)} URLs")
     return all_data
 
+def _record_dict(data):
+    """Plain dict of a BirdCastRecord (dicts are returned unchanged)"""
+    return data if isinstance(data, dict) else asdict(data)
+
+def _deduplicate_records(combined_df):
+    """
+    Remove duplicate records - keep the most recent entry per region per day
+    
+    Args:
+        combined_df: DataFrame of records with scrape_timestamp as UTC datetimes
+        
+    Returns:
+        Deduplicated DataFrame, most recent records first
+    """
+    if len(combined_df) == 0 or 'scrape_timestamp' not in combined_df.columns:
+        return combined_df
+    
+    # Use scrape_timestamp directly since it's already a datetime object
+    combined_df = combined_df.copy()
+    combined_df['scrape_timestamp_dt'] = combined_df['scrape_timestamp']
+    
+    # Create comprehensive deduplication key
+    dedup_columns = ['scrape_timestamp_dt']
+    
+    # Add region_code if available
+    if 'region_code' in combined_df.columns:
+        dedup_columns.append('region_code')
+    elif 'url' in combined_df.columns:
+        # Fallback to URL if region_code is missing
+        dedup_columns.append('url')
+    
+    # Create date key for deduplication (prefer migration_date, fallback to scrape date)
+    if 'migration_date' in combined_df.columns and combined_df['migration_date'].notna().any():
+        combined_df['date_key'] = combined_df['migration_date'].fillna(
+            combined_df['scrape_timestamp_dt'].dt.date.astype(str)
+        )
+    else:
+        combined_df['date_key'] = combined_df['scrape_timestamp_dt'].dt.date.astype(str)
+    
+    # Add date_key to deduplication columns
+    if 'region_code' in combined_df.columns or 'url' in combined_df.columns:
+        dedup_subset = [col for col in dedup_columns if col != 'scrape_timestamp_dt'] + ['date_key']
+    else:
+        # If no region identifier, use more strict deduplication
+        dedup_subset = ['date_key', 'scrape_timestamp_dt']
+    
+    # Sort by timestamp (most recent first) then drop duplicates
+    combined_df = combined_df.sort_values('scrape_timestamp_dt', ascending=False)
+    
+    # Remove exact duplicates first (all columns identical except timestamp)
+    data_columns = [col for col in combined_df.columns if col not in ['scrape_timestamp', 'scrape_timestamp_dt', 'date_key']]
+    if len(data_columns) > 0:
+        combined_df = combined_df.drop_duplicates(subset=data_columns, keep='first')
+    
+    # Then remove duplicates by region and date (keep most recent)
+    combined_df = combined_df.drop_duplicates(subset=dedup_subset, keep='first')
+    
+    # Remove helper columns
+    return combined_df.drop(['scrape_timestamp_dt', 'date_key'], axis=1)
+
+def _migrate_legacy_parquet(filename):
+    """
+    Turn a single-file Parquet history (the format written before save_to_parquet
+    switched to datasets) into the first file of a dataset directory at the same path
+    
+    Args:
+        filename: Path of the Parquet dataset
+    """
+    if not os.path.isfile(filename):
+        return
+    
+    legacy_tmp = filename + '.legacy'
+    os.replace(filename, legacy_tmp)
+    os.makedirs(filename)
+    os.replace(legacy_tmp, os.path.join(filename, 'legacy.parquet'))
+    logging.info(f"Moved existing Parquet history into dataset directory {filename}")
+
+def _record_index_rows(table):
+    """
+    Index rows (region, date_key, scrape_timestamp, content_hash) for a table of records
+    
+    The region/date key matches _deduplicate_records; the hash covers every saved
+    column except scrape_timestamp, so equal hashes mean the same data re-scraped
+    
+    Args:
+        table: pyarrow Table with the PARQUET_SCHEMA columns
+    """
+    rows = []
+    for data in table.select(PARQUET_SCHEMA.names).to_pylist():
+        scraped_at = data.pop('scrape_timestamp')
+        digest = hashlib.blake2b(
+            orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS), digest_size=8
+        ).digest()
+        rows.append((
+            data['region_code'] or data['url'],
+            data['migration_date'] or (scraped_at.strftime('%Y-%m-%d') if scraped_at else 'unknown'),
+            scraped_at.strftime('%Y-%m-%dT%H:%M:%S.%f') if scraped_at else '',
+            int.from_bytes(digest, 'big', signed=True)
+        ))
+    return rows
+
+def _open_record_index(filename):
+    """
+    Open the SQLite index of the latest record per region and day in a Parquet dataset,
+    building it from the data already saved there the first time
+    """
+    index_path = os.path.join(filename, _RECORD_INDEX_FILENAME)
+    is_new = not os.path.exists(index_path)
+    conn = sqlite3.connect(index_path)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS latest_records (region TEXT, date_key TEXT, '
+        'scrape_timestamp TEXT, content_hash INTEGER, PRIMARY KEY (region, date_key))'
+    )
+    if is_new:
+        existing = ds.dataset(filename, schema=PARQUET_SCHEMA, format='parquet',
+                              partitioning=_PARQUET_PARTITIONING).to_table()
+        _update_record_index(conn, _record_index_rows(existing))
+    return conn
+
+def _reset_record_index(filename):
+    """
+    Drop a dataset's record index after files were added without save_to_parquet,
+    so the next save rebuilds it from everything in the dataset
+    """
+    index_path = os.path.join(filename, _RECORD_INDEX_FILENAME)
+    if os.path.exists(index_path):
+        os.remove(index_path)
+
+def _update_record_index(conn, index_rows):
+    """Store index rows, keeping the newest scrape per region and day"""
+    with conn:
+        conn.executemany(
+            'INSERT INTO latest_records VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (region, date_key) DO UPDATE SET '
+            'scrape_timestamp = excluded.scrape_timestamp, content_hash = excluded.content_hash '
+            'WHERE excluded.scrape_timestamp >= latest_records.scrape_timestamp',
+            index_rows
+        )
+
+def _with_scrape_date(table):
+    """Add the scrape_date partition column (UTC day of scrape_timestamp) to a records table"""
+    return table.append_column('scrape_date', pa.array([
+        scraped_at.strftime('%Y-%m-%d') if scraped_at else 'unknown'
+        for scraped_at in table['scrape_timestamp'].to_pylist()
+    ], pa.string()))
+
+def _write_dataset_files(table, filename, compression='snappy', compression_level=None):
+    """
+    Write a records table as new files of the Parquet dataset (existing files are kept),
+    with row groups of at most 50,000 rows and dictionary-encoded columns
+    """
+    write_time = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+    ds.write_dataset(
+        table,
+        filename,
+        format='parquet',
+        partitioning=_PARQUET_PARTITIONING,
+        basename_template=f"part-{write_time}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore',
+        max_rows_per_group=50_000,
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=compression,
+            compression_level=compression_level,
+            use_dictionary=True
+        )
+    )
+
+def _to_int(value):
+    """Integer value of a saved count (int or numeric string), or None if it has none"""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        return int(number) if number.is_integer() else None
+
+def _to_utc_datetime(value):
+    """UTC datetime of an ISO timestamp (string or datetime; naive means UTC), or None"""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _records_table(data_list):
+    """
+    Typed Arrow table (PARQUET_SCHEMA) of BirdCastRecords / data dictionaries
+    
+    Each column is built once straight from the records (no intermediate DataFrame);
+    values that cannot be parsed as the column's type become nulls
+    """
+    records = [_record_dict(data) for data in data_list]
+    columns = {}
+    for field in PARQUET_SCHEMA:
+        values = [data.get(field.name) for data in records]
+        if pa.types.is_integer(field.type):
+            values = [_to_int(value) for value in values]
+        elif pa.types.is_timestamp(field.type):
+            values = [_to_utc_datetime(value) for value in values]
+        columns[field.name] = pa.array(values, field.type)
+    return pa.Table.from_pydict(columns)
+
 def save_to_parquet(data_list, filename):
     """
-    Save data to Parquet file (append with deduplication)
+    Save data to a Parquet dataset (append-only, deduplicated by load_parquet)
+    
+    Each call writes the new records as new files under
+    filename/scrape_date=YYYY-MM-DD/, so saving never reads or rewrites the history.
+    A small SQLite index (filename/_latest_records.sqlite) remembers the latest data
+    saved per region and day; records identical to it are not written again.
     
     Args:
-        data_list: List of data dictionaries or single dictionary
-        filename: Full path to the Parquet file
+        data_list: List of BirdCastRecords / data dictionaries, or a single one
+        filename: Path of the Parquet dataset directory
     """
     if not data_list:
         return
     
-    # Handle both single data dict and list of data dicts
-    if isinstance(data_list, dict):
+    # Handle both a single record and a list of records
+    if isinstance(data_list, (dict, BirdCastRecord)):
         data_list = [data_list]
     
-    # Convert new data to DataFrame
-    new_df = pd.DataFrame(data_list)
+    table = _with_scrape_date(_records_table(data_list))
     
-    # Optimize data types for better compression
-    for col in new_df.columns:
-        if col in ['total_birds', 'peak_birds_in_flight', 'flight_speed_mph', 'flight_altitude_ft']:
-            new_df[col] = pd.to_numeric(new_df[col], errors='coerce').astype('Int64')
-        elif col in ['migration_start_utc', 'migration_end_utc', 'scrape_timestamp']:
-            # Convert datetime strings to proper datetime objects
-            new_df[col] = pd.to_datetime(new_df[col], errors='coerce', utc=True)
+    _migrate_legacy_parquet(filename)
+    os.makedirs(filename, exist_ok=True)
     
-    # Load existing data if file exists
-    if os.path.isfile(filename):
-        try:
-            existing_df = pd.read_parquet(filename)
-            
-            # Ensure datetime columns in existing data are properly typed
-            for col in existing_df.columns:
-                if col in ['migration_start_utc', 'migration_end_utc', 'scrape_timestamp']:
-                    if existing_df[col].dtype == 'object':
-                        existing_df[col] = pd.to_datetime(existing_df[col], errors='coerce', utc=True)
-            
-            # Combine with new data
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-        except Exception as e:
-            logging.warning(f"Could not read existing Parquet file: {e}. Creating new file.")
-            combined_df = new_df
-    else:
-        combined_df = new_df
-    
-    # Remove duplicates - keep most recent entry per region per day
-    if len(combined_df) > 0 and 'scrape_timestamp' in combined_df.columns:
-        # Use scrape_timestamp directly since it's already a datetime object
-        combined_df['scrape_timestamp_dt'] = combined_df['scrape_timestamp']
-        
-        # Create comprehensive deduplication key
-        dedup_columns = ['scrape_timestamp_dt']
-        
-        # Add region_code if available
-        if 'region_code' in combined_df.columns:
-            dedup_columns.append('region_code')
-        elif 'url' in combined_df.columns:
-            # Fallback to URL if region_code is missing
-            dedup_columns.append('url')
-        
-        # Create date key for deduplication (prefer migration_date, fallback to scrape date)
-        if 'migration_date' in combined_df.columns and combined_df['migration_date'].notna().any():
-            combined_df['date_key'] = combined_df['migration_date'].fillna(
-                combined_df['scrape_timestamp_dt'].dt.date.astype(str)
-            )
-        else:
-            combined_df['date_key'] = combined_df['scrape_timestamp_dt'].dt.date.astype(str)
-        
-        # Add date_key to deduplication columns
-        if 'region_code' in combined_df.columns or 'url' in combined_df.columns:
-            dedup_subset = [col for col in dedup_columns if col != 'scrape_timestamp_dt'] + ['date_key']
-        else:
-            # If no region identifier, use more strict deduplication
-            dedup_subset = ['date_key', 'scrape_timestamp_dt']
-        
-        # Sort by timestamp (most recent first) then drop duplicates
-        combined_df = combined_df.sort_values('scrape_timestamp_dt', ascending=False)
+    index_rows = _record_index_rows(table)
+    with closing(_open_record_index(filename)) as conn:
+        keep = [
+            conn.execute(
+                'SELECT content_hash FROM latest_records WHERE region = ? AND date_key = ?',
+                (region, date_key)
+            ).fetchone() != (content_hash,)
+            for region, date_key, _, content_hash in index_rows
+        ]
         
-        # Remove exact duplicates first (all columns identical except timestamp)
-        data_columns = [col for col in combined_df.columns if col not in ['scrape_timestamp', 'scrape_timestamp_dt', 'date_key']]
-        if len(data_columns) > 0:
-            combined_df = combined_df.drop_duplicates(subset=data_columns, keep='first')
+        if not any(keep):
+            logging.info(f"All {len(data_list)} region(s) unchanged since the last save to {filename}")
+            return
         
-        # Then remove duplicates by region and date (keep most recent)
-        combined_df = combined_df.drop_duplicates(subset=dedup_subset, keep='first')
+        _write_dataset_files(table.filter(pa.array(keep)), filename)
         
-        # Remove helper columns
-        combined_df = combined_df.drop(['scrape_timestamp_dt', 'date_key'], axis=1)
+        # Only record what was actually written
+        _update_record_index(conn, [row for row, write in zip(index_rows, keep) if write])
+    
+    logging.info(f"Data for {sum(keep)} of {len(data_list)} region(s) saved to {filename}")
+
+def append_to_parquet(data_list, filename, compression='snappy', compression_level=None):
+    """
+    Add records to a Parquet dataset as-is (no skipping of unchanged records), e.g. to
+    import histories saved in other formats; load_parquet deduplicates them
+    
+    Args:
+        data_list: List of BirdCastRecords / data dictionaries, or a single one
+        filename: Path of the Parquet dataset directory (an existing single-file
+            history is moved into it first)
+        compression: Parquet compression codec
+        compression_level: Optional codec compression level
+    """
+    if not data_list:
+        return
+    
+    # Handle both a single record and a list of records
+    if isinstance(data_list, (dict, BirdCastRecord)):
+        data_list = [data_list]
+    
+    table = _with_scrape_date(_records_table(data_list))
+    
+    _migrate_legacy_parquet(filename)
+    _write_dataset_files(table, filename, compression, compression_level)
+    # The record index does not know these rows - rebuild it on the next save
+    _reset_record_index(filename)
+    
+    logging.info(f"Data for {len(data_list)} record(s) added to {filename}")
+
+def _reparse_migration_times(df):
+    """
+    Recompute migration_start_utc / migration_end_utc from the raw page strings
+    
+    Records saved before the parser honoured time zone names (e.g. EDT) hold the
+    local time labelled as UTC; reparsing gives every row the same meaning. Rows
+    whose raw string is missing or unparseable keep their stored value.
+    """
+    for raw_col, utc_col in (('migration_start_raw', 'migration_start_utc'),
+                             ('migration_end_raw', 'migration_end_utc')):
+        raw = df[raw_col].astype(object)
+        reparsed = pd.to_datetime(
+            raw.where(raw.notna(), None).map(parse_datetime_string, na_action='ignore'),
+            format='ISO8601', utc=True, errors='coerce'
+        )
+        df[utc_col] = reparsed.fillna(df[utc_col]).astype(df[utc_col].dtype)
+    return df
+
+def load_parquet(filename, columns=None):
+    """
+    Load the records saved by save_to_parquet, keeping the most recent entry per region per day
+    
+    Args:
+        filename: Path of the Parquet dataset (or a single-file Parquet history)
+        columns: Optional list of columns to return (default: all)
         
-        logging.info(f"After deduplication: {len(combined_df)} unique records remaining")
+    Returns:
+        DataFrame of deduplicated records (empty if nothing has been saved yet)
+    """
+    if not os.path.exists(filename):
+        return PARQUET_SCHEMA.empty_table().to_pandas()
+    
+    dataset = ds.dataset(
+        filename,
+        schema=PARQUET_SCHEMA,
+        format='parquet',
+        partitioning=_PARQUET_PARTITIONING
+    )
+    df = dataset.to_table().to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    df = _deduplicate_records(_reparse_migration_times(df))
+    
+    logging.info(f"Loaded {len(df)} unique records from {filename}")
+    return df[columns] if columns else df
+
+def compact_parquet(filename):
+    """
+    Rewrite a Parquet dataset so it holds only the records load_parquet keeps
+    
+    save_to_parquet only ever appends, so superseded scrapes accumulate; run this
+    occasionally (e.g. weekly from cron) while no scraper is writing to the dataset.
+    The new files are written next to the dataset and swapped in when complete.
+    The record index is rebuilt from the compacted data on the next save.
+    
+    Args:
+        filename: Path of the Parquet dataset directory
+    """
+    compact_dir = filename + '.compacting'
+    old_dir = filename + '.old'
+    
+    # A run interrupted between the two renames left the dataset under old_dir
+    if not os.path.exists(filename) and os.path.isdir(old_dir):
+        os.replace(old_dir, filename)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    shutil.rmtree(compact_dir, ignore_errors=True)
+    
+    _migrate_legacy_parquet(filename)
+    if not os.path.isdir(filename):
+        logging.info(f"No Parquet dataset to compact at {filename}")
+        return
+    
+    df = load_parquet(filename)
+    if len(df) == 0:
+        logging.info(f"No records to compact in {filename}")
+        return
+    table = _with_scrape_date(pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False))
     
-    # Save to Parquet with compression
-    combined_df.to_parquet(filename, compression='snappy', index=False)
+    _write_dataset_files(table, compact_dir)
+    if not os.path.isdir(compact_dir):
+        logging.error(f"Compaction of {filename} wrote no files - dataset left unchanged")
+        return
+    os.replace(filename, old_dir)
+    os.replace(compact_dir, filename)
+    shutil.rmtree(old_dir)
     
-    logging.info(f"Data for {len(data_list)} region(s) saved to {filename} (total records: {len(combined_df)})")
+    logging.info(f"Compacted {filename} to {len(df)} records")
 
-def save_to_json(data_list, filename):
+def save_to_json(data_list, filename, json_lines=True):
     """
-    Save data to JSON file (append to list) - DEPRECATED: Use save_to_parquet instead
+    Save data to JSON file - DEPRECATED: Use save_to_parquet instead
     
     Args:
-        data_list: List of data dictionaries or single dictionary
+        data_list: List of BirdCastRecords / data dictionaries, or a single one
         filename: Full path to the JSON file
+        json_lines: If True (default), append one JSON record per line (JSON Lines)
+            so each save only writes the new records. If False, load the existing
+            JSON list, extend it and rewrite the whole file (legacy format).
     """
     if not data_list:
         return
     
-    # Handle both single data dict and list of data dicts
-    if isinstance(data_list, dict):
+    # Handle both a single record and a list of records
+    if isinstance(data_list, (dict, BirdCastRecord)):
         data_list = [data_list]
+    
+    if json_lines:
+        with open(filename, 'ab') as f:
+            for data in data_list:
+                f.write(orjson.dumps(data) + b'\n')
+        
+        logging.info(f"Data for {len(data_list)} region(s) saved to {filename}")
+        return
         
     if os.path.isfile(filename):
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open(filename, 'rb') as f:
             try:
-                existing_data = json.load(f)
-            except json.JSONDecodeError:
+                existing_data = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 existing_data = []
     else:
         existing_data = []
     
     existing_data.extend(data_list)
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(existing_data, f, indent=2, ensure_ascii=False)
+    # orjson writes UTF-8 directly (same output as json.dump with ensure_ascii=False);
+    # compact rather than indented, since the whole history is rewritten on every save
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(existing_data))
     
     logging.info(f"Data for {len(data_list)} region(s) saved to {filename}")
 
+def load_json_records(filename):
+    """
+    Load the records saved by save_to_json
+    
+    Args:
+        filename: Full path to a JSON Lines (.jsonl) file or a legacy JSON list file
+        
+    Returns:
+        List of data dictionaries (empty if the file does not exist)
+    """
+    if not os.path.isfile(filename):
+        return []
+    
+    with open(filename, 'rb') as f:
+        if str(filename).endswith('.jsonl'):
+            return [orjson.loads(line) for line in f if line.strip()]
+        return orjson.loads(f.read())
+
 def save_to_csv(data_list, filename):
     """
     Save data to CSV file
     
     Args:
-        data_list: List of data dictionaries or single dictionary
+        data_list: List of BirdCastRecords / data dictionaries, or a single one
         filename: Full path to the CSV file
     """
     if not data_list:
         return
     
-    # Handle both single data dict and list of data dicts
-    if isinstance(data_list, dict):
+    # Handle both a single record and a list of records
+    if isinstance(data_list, (dict, BirdCastRecord)):
         data_list = [data_list]
+    
+    # Reuse the header already on disk when appending so new rows line up with it
+    header = None
+    if os.path.isfile(filename):
+        with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile), None)
+    fieldnames = header or CSV_FIELDNAMES
+    
+    with open(filename, 'a', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+        writer = csv.writer(csvfile)
+        
+        if not header:
+            writer.writerow(fieldnames)
         
-    file_exists = os.path.isfile(filename)
-    
-    # Define consistent column order for BirdCast data
-    expected_fieldnames = [
-        'scrape_timestamp',
-        'url', 
-        'region_code',
-        'region_name',
-        'total_birds',
-        'peak_birds_in_flight',
-        'flight_direction',
-        'flight_speed_mph',
-        'flight_altitude_ft',
-        'migration_start_raw',
-        'migration_start_utc',
-        'migration_end_raw',
-        'migration_end_utc',
-        'migration_date'
-    ]
-    
-    # Get all unique fieldnames from all records
-    all_fieldnames = set()
-    for data in data_list:
-        all_fieldnames.update(data.keys())
-    
-    # Use expected order for known fields, append any unexpected fields at the end
-    ordered_fieldnames = []
-    for field in expected_fieldnames:
-        if field in all_fieldnames:
-            ordered_fieldnames.append(field)
-            all_fieldnames.remove(field)
-    
-    # Add any remaining fields that weren't in the expected list
-    ordered_fieldnames.extend(sorted(all_fieldnames))
-    
-    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=ordered_fieldnames)
-        
-        if not file_exists:
-            writer.writeheader()
-        
-        for data in data_list:
-            writer.writerow(data)
+        # Plain rows in header order (missing fields write as empty cells, extra
+        # ones are dropped) - several times faster than a DictWriter over asdict() copies
+        writer.writerows(
+            [data.get(name) for name in fieldnames] if isinstance(data, dict)
+            else [getattr(data, name, None) for name in fieldnames]
+            for data in data_list
+        )
     
     logging.info(f"Data for {len(data_list)} region(s) saved to {filename}")
 
+def _read_flyway_urls(csv_file):
+    """Read the BirdCast URLs from a flyway CSV file"""
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        # Plain rows and one header lookup instead of a dict per county
+        reader = csv.reader(f)
+        idx = next(reader, []).index('birdcast_url')
+        return [row[idx] for row in reader if len(row) > idx and row[idx]]
+
 def load_flyway_urls_from_csv(csv_filename):
     """
     Load BirdCast URLs from a flyway corridor analysis CSV file
@@ -466,13 +1030,8 @@ def load_flyway_urls_from_csv(csv_filename):
         logging.error("Please run the appropriate flyway corridor analysis script first to generate the county list")
         return []
     
-    urls = []
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if 'birdcast_url' in row and row['birdcast_url']:
-                    urls.append(row['birdcast_url'])
+        urls = _read_flyway_urls(csv_file)
         
         logging.info(f"Loaded {len(urls)} URLs from {csv_file}")
         return urls
@@ -486,28 +1045,29 @@ def print_scraper_summary(data, scraper_name, data_filename):
     Print a summary of scraping results
     
     Args:
-        data: List of scraped data
+        data: List of BirdCastRecords (or data dictionaries) returned by scrape_data
         scraper_name: Name of the scraper
         data_filename: Name of the data file (without path)
     """
     if data:
-        print(f"{scraper_name} - SUCCESS")
-        print("=" * (len(scraper_name) + 10))
-        print(f"Scraped data for {len(data)} regions at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        data = [_record_dict(region_data) for region_data in data]
+        # Collect the report and print it in one write
+        lines = [f"{scraper_name} - SUCCESS", "=" * (len(scraper_name) + 10)]
+        lines.append(f"Scraped data for {len(data)} regions at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Count by state if region_code is available
         if data and 'region_code' in data[0]:
-            state_counts = {}
-            for region_data in data:
-                region_code = region_data.get('region_code', '')
-                if region_code and len(region_code) >= 5:  # Format: US-XX-XXX
-                    state = region_code[3:5]  # Extract state code
-                    state_counts[state] = state_counts.get(state, 0) + 1
+            # Format: US-XX-XXX, state code at [3:5]
+            state_counts = Counter(
+                region_code[3:5]
+                for region_code in (region_data.get('region_code') for region_data in data)
+                if region_code and len(region_code) >= 5
+            )
             
             if state_counts:
-                print(f"\nCounties by state:")
+                lines.append(f"\nCounties by state:")
                 for state, count in sorted(state_counts.items()):
-                    print(f"   {state}: {count} counties")
+                    lines.append(f"   {state}: {count} counties")
         
         # Show sample data
         for i, region_data in enumerate(data[:3]):  # Show first 3 regions
@@ -516,16 +1076,17 @@ def print_scraper_summary(data, scraper_name, data_filename):
             peak_birds = region_data.get('peak_birds_in_flight', 'N/A')
             direction = region_data.get('flight_direction', 'N/A')
             
-            print(f"\n{region_name}:")
-            print(f"   Total birds: {total_birds:,}" if isinstance(total_birds, int) else f"   Total birds: {total_birds}")
-            print(f"   Peak in flight: {peak_birds:,}" if isinstance(peak_birds, int) else f"   Peak in flight: {peak_birds}")
-            print(f"   Direction: {direction}")
+            lines.append(f"\n{region_name}:")
+            lines.append(f"   Total birds: {total_birds:,}" if isinstance(total_birds, int) else f"   Total birds: {total_birds}")
+            lines.append(f"   Peak in flight: {peak_birds:,}" if isinstance(peak_birds, int) else f"   Peak in flight: {peak_birds}")
+            lines.append(f"   Direction: {direction}")
         
         if len(data) > 3:
-            print(f"\n... and {len(data) - 3} more regions")
+            lines.append(f"\n... and {len(data) - 3} more regions")
         
-        print(f"\nData saved to: {data_filename}")
-        print("=" * (len(scraper_name) + 10))
+        lines.append(f"\nData saved to: {data_filename}")
+        lines.append("=" * (len(scraper_name) + 10))
+        print("\n".join(lines))
         
         logging.info("Scraping completed successfully")
     else: